@@ -1,17 +1,59 @@
 from fastapi import APIRouter, File, UploadFile, HTTPException, Request
-from fastapi.responses import JSONResponse
-import tempfile
-import os
-from typing import Dict, List, Optional
-from dataclasses import asdict
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.routing import APIRoute
+import asyncio
+import fitz
+from blake3 import blake3
+from typing import Callable, Dict, List, Optional, Tuple
 from app.services.cv_parser import cv_reader
-from app.core.nlp import get_nlp
+from app.core.nlp import is_nlp_available
+from app.core.config import settings
 from app.core.limiter import limiter
 from app.utils import dataclass_to_dict
-from app.models.cv import CVData
+from app.models.cv import ParseCVResponse
 
 router = APIRouter()
 
+class UploadSizeLimitRoute(APIRoute):
+    """Route that rejects oversized uploads from the headers, before the body is read"""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def limited_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length")
+            if content_length is None:
+                raise HTTPException(status_code=411, detail="Content-Length header is required")
+            if not content_length.isdigit() or int(content_length) > settings.MAX_CV_BYTES:
+                raise HTTPException(status_code=413, detail="File too large")
+            return await handler(request)
+
+        return limited_handler
+
+# Size of each block read from the upload
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Caps in-flight parses so excess requests wait instead of exhausting memory
+PARSE_SEM = asyncio.Semaphore(settings.CV_PARSE_CONCURRENCY)
+
+def read_upload(src) -> Tuple[bytearray, str]:
+    """Read an upload in chunks and return its content and BLAKE3 hash"""
+    content_hash = blake3()
+    data = bytearray()
+    while chunk := src.read(UPLOAD_CHUNK_SIZE):
+        # Reject non-PDF content before reading the rest of the upload
+        if not data and not chunk.startswith(b'%PDF-'):
+            raise HTTPException(status_code=400, detail="Not a valid PDF")
+        # Content-Length is checked up front, but clients can lie about it
+        if len(data) + len(chunk) > settings.MAX_CV_BYTES:
+            raise HTTPException(status_code=413, detail="File too large")
+        content_hash.update(chunk)
+        data += chunk
+    if not data:
+        raise HTTPException(status_code=400, detail="Not a valid PDF")
+    return data, content_hash.hexdigest()
+
 @router.get("/")
 async def root():
     """Root endpoint"""
@@ -27,13 +69,11 @@ async def root():
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    nlp = get_nlp()
     return {
         "status": "healthy",
-        "spacy_loaded": nlp is not None
+        "spacy_loaded": is_nlp_available()
     }
 
-@router.post("/parse-cv")
 @limiter.limit("5/minute")
 async def parse_cv(request: Request, file: UploadFile = File(...)):
     """
@@ -44,32 +84,35 @@ async def parse_cv(request: Request, file: UploadFile = File(...)):
     if not file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
-    # Create temporary file to save uploaded PDF
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-        temp_path = temp_file.name
+    try:
+        async with PARSE_SEM:
+            # Read uploaded file in chunks, off the event loop, hashing it on the way
+            data, file_hash = await run_in_threadpool(read_upload, file.file)
 
-        try:
-            # Read and save uploaded file
-            content = await file.read()
-            temp_file.write(content)
-            temp_file.flush()
+            # Parse CV in a worker thread so the event loop stays responsive
+            cv_data = await run_in_threadpool(cv_reader.parse_cv_bytes, data, file_hash)
 
-            # Parse CV
-            cv_data = cv_reader.parse_cv(temp_path)
+        # Returned as a Response so FastAPI skips re-validating it against response_model
+        return ORJSONResponse(content={
+            "success": True,
+            "filename": file.filename,
+            "data": dataclass_to_dict(cv_data)
+        })
 
-            # Convert to dictionary
-            result = dataclass_to_dict(cv_data)
+    except HTTPException:
+        raise
 
-            return JSONResponse(content={
-                "success": True,
-                "filename": file.filename,
-                "data": result
-            })
+    except fitz.FileDataError as e:
+        raise HTTPException(status_code=422, detail=f"Could not read PDF: {str(e)}")
 
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error parsing CV: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error parsing CV: {str(e)}")
 
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+# The size check runs before FastAPI reads the form body for the handler
+router.add_api_route(
+    "/parse-cv",
+    parse_cv,
+    methods=["POST"],
+    response_model=ParseCVResponse,
+    route_class_override=UploadSizeLimitRoute
+)
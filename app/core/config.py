@@ -5,10 +5,19 @@ class Settings:
     VERSION: str = "1.0.0"
     API_V1_STR: str = "/api/v1"
 
+    # Uploads
+    MAX_CV_BYTES: int = int(os.getenv("MAX_CV_BYTES", str(20 * 1024 * 1024)))
+    # Maximum number of CVs read and parsed at once per worker
+    CV_PARSE_CONCURRENCY: int = int(os.getenv("CV_PARSE_CONCURRENCY", "4"))
+    # Processes per worker for extracting text from very large PDFs
+    PDF_PAGE_WORKERS: int = max(1, int(os.getenv("PDF_PAGE_WORKERS", "2")))
+
     # Redis
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
     # Spacy
     SPACY_MODEL: str = "en_core_web_sm"
+    # Load the model at import time so gunicorn --preload workers share it
+    PRELOAD_NLP: bool = os.getenv("PRELOAD_NLP", "false").lower() == "true"
 
 settings = Settings()
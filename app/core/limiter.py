@@ -1,4 +1,12 @@
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-limiter = Limiter(key_func=get_remote_address)
+from app.core.config import settings
+
+# Shared Redis storage so the limit holds across all gunicorn workers;
+# falls back to per-worker in-memory limits while Redis is unreachable
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.REDIS_URL,
+    in_memory_fallback_enabled=True
+)
@@ -1,15 +1,38 @@
-import spacy
+import importlib.util
+import threading
+from functools import lru_cache
+
+from app.core.config import settings
+
+# Pipeline components the CV parser never uses; only tok2vec, tagger and ner are kept
+EXCLUDED_PIPES = ['parser', 'attribute_ruler', 'lemmatizer', 'senter']
 
 nlp = None
+_nlp_lock = threading.Lock()
 
 def load_nlp():
     global nlp
+    # Imported here so processes that never need the model skip spacy's import cost
+    import spacy
     try:
-        nlp = spacy.load('en_core_web_sm')
+        nlp = spacy.load(settings.SPACY_MODEL, exclude=EXCLUDED_PIPES)
         print("Spacy model loaded.")
     except OSError:
         print("Spacy model not found. Please install it with: python -m spacy download en_core_web_sm")
         nlp = None
 
 def get_nlp():
+    """Return the spacy model, loading it on first use"""
+    if nlp is None:
+        with _nlp_lock:
+            if nlp is None:
+                load_nlp()
     return nlp
+
+@lru_cache(maxsize=None)
+def _is_model_installed():
+    return importlib.util.find_spec(settings.SPACY_MODEL) is not None
+
+def is_nlp_available():
+    """Whether the model is loaded or installed, without loading it"""
+    return nlp is not None or _is_model_installed()
@@ -1,17 +1,38 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.api.endpoints import router
 from app.core.config import settings
-from app.core.nlp import load_nlp
 from app.core.limiter import limiter
+from app.core.nlp import get_nlp, load_nlp
+from app.services.cv_parser import cv_reader
+
+if settings.PRELOAD_NLP:
+    # Loaded once in the gunicorn master and shared copy-on-write with workers
+    load_nlp()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up shared state on startup and release it on shutdown"""
+    if settings.PRELOAD_NLP:
+        # No-op load when the master already did it; one call warms its caches
+        nlp = get_nlp()
+        if nlp is not None:
+            nlp("warmup")
+    yield
+    cv_reader.close()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Extract structured information from CV/Resume PDFs",
-    version=settings.VERSION
+    version=settings.VERSION,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Initialize Limiter
@@ -27,9 +48,4 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.on_event("startup")
-async def startup_event():
-    """Load spacy model on startup"""
-    load_nlp()
-
 app.include_router(router)
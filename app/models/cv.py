@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class WorkExperience:
     start_date: str
     end_date: str
@@ -11,7 +11,7 @@ class WorkExperience:
     responsibilities: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Education:
     start_date: str
     end_date: str
@@ -20,20 +20,20 @@ class Education:
     location: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     name: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Certification:
     date: str
     name: str
     issuer: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CVData:
     name: Optional[str] = None
     title: Optional[str] = None
@@ -51,17 +51,9 @@ class CVData:
     certifications: List[Certification] = field(default_factory=list)
     volunteering: List[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        # Ensure lists/dicts are not None if passed as None explicitly
-        if self.technical_skills is None:
-            self.technical_skills = {}
-        if self.work_experience is None:
-            self.work_experience = []
-        if self.education is None:
-            self.education = []
-        if self.projects is None:
-            self.projects = []
-        if self.certifications is None:
-            self.certifications = []
-        if self.volunteering is None:
-            self.volunteering = []
+
+@dataclass(slots=True)
+class ParseCVResponse:
+    success: bool
+    filename: str
+    data: CVData
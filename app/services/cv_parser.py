@@ -1,51 +1,178 @@
+import io
 import re
+import fitz
 import pdfplumber
-import spacy
 import redis
-import hashlib
-import json
-from typing import Dict, List, Optional
+import mmap
+import msgpack
+import multiprocessing
+import os
+import threading
+from blake3 import blake3
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional
 from app.models.cv import CVData, WorkExperience, Education, Project, Certification
 from app.core.config import settings
-from app.utils import dataclass_to_dict
+from app.utils import dataclass_to_dict, make_loader
+
+# The PDF library is not safe to drive from several threadpool threads at once
+_pdf_lock = threading.Lock()
+
+# Patterns, compiled once at import
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{3,4}')
+LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[A-Za-z0-9_-]+/?', re.IGNORECASE)
+GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9_-]+/?', re.IGNORECASE)
+# All contact fields in one alternation so the text is scanned once
+CONTACT_RE = re.compile('|'.join([
+    f'(?P<email>{EMAIL_RE.pattern})',
+    f'(?P<linkedin>(?i:{LINKEDIN_RE.pattern}))',
+    f'(?P<github>(?i:{GITHUB_RE.pattern}))',
+    f'(?P<phone>{PHONE_RE.pattern})',
+]))
+CONTACT_FIELDS = ('email', 'linkedin', 'github', 'phone')
+DATE_RE = re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|\d{4}|Present|Current')
+NAME_RE = re.compile(r'^[A-Z][a-zA-Z\s]+$')
+TITLE_KEYWORD_RE = re.compile(r'developer|engineer|manager', re.IGNORECASE)
+LOCATION_RE = re.compile(r'\b(?:Indonesia|Malaysia|Singapore|India|USA|UK)\b', re.IGNORECASE)
+NON_DIGIT_RE = re.compile(r'[^0-9]')
+JOB_DATE_RANGE_RE = re.compile(r'(\w+\s+\d{4})\s*[–—-]\s*(\w+\s+\d{4}|Present|Current)')
+YEAR_RE = re.compile(r'\d{4}')
+YEAR_RANGE_RE = re.compile(r'(\d{4})\s*[–—-]\s*(\d{4}|Present)')
+YEAR_RANGE_STRIP_RE = re.compile(r'\d{4}\s*[–—-]\s*(?:\d{4}|Present)')
+MONTH_YEAR_RE = re.compile(r'([A-Z][a-z]{2}\s+\d{4})')
+
+# Section headers, one named group per section
+SECTION_RE = re.compile(
+    r'^(?:'
+    r'(?P<summary>Summary|Profile|About|Objective)'
+    r'|(?P<technical_skills>Technical Skills|Skills|Competencies)'
+    r'|(?P<experience>Experience|Work Experience|Employment|Professional Experience)'
+    r'|(?P<education>Education|Academic Background|Qualifications)'
+    r'|(?P<projects>Projects|Personal Projects|Key Projects)'
+    r'|(?P<certifications>Certification|Certifications|Certificates)'
+    r'|(?P<volunteering>Volunteering|Volunteer|Community)'
+    r')\s*$',
+    re.IGNORECASE
+)
+
+# Shared by all readers; connections are opened lazily on first command
+try:
+    REDIS_POOL = redis.ConnectionPool.from_url(settings.REDIS_URL, max_connections=32)
+except Exception as e:
+    print(f"Invalid Redis URL: {e}")
+    REDIS_POOL = None
+
+# Positional constructors for rebuilding cached results
+_load_work_experience = make_loader(WorkExperience)
+_load_education = make_loader(Education)
+_load_project = make_loader(Project)
+_load_certification = make_loader(Certification)
+
+# PDFs with more pages than this have their text extracted across processes
+LARGE_PDF_PAGES = 20
+
+_page_pool = None
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Create the page extraction pool on first use"""
+    global _page_pool
+    if _page_pool is None:
+        # Not fork: children of a threaded server can inherit held locks
+        _page_pool = ProcessPoolExecutor(
+            max_workers=settings.PDF_PAGE_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+    return _page_pool
+
+def _discard_page_pool(pool: ProcessPoolExecutor):
+    """Drop a broken page extraction pool so the next large PDF starts a new one"""
+    global _page_pool
+    if _page_pool is pool:
+        _page_pool = None
+    pool.shutdown(wait=False)
+
+def _shutdown_page_pool():
+    """Stop the page extraction pool if it was started"""
+    global _page_pool
+    if _page_pool is not None:
+        _page_pool.shutdown()
+        _page_pool = None
+
+def _extract_pages(doc, start: int, stop: int) -> str:
+    """Extract text from pages [start, stop) of an opened PDF document"""
+    parts = []
+    for page_number in range(start, stop):
+        # sort=True orders blocks top-to-bottom, left-to-right for column layouts
+        page_text = doc[page_number].get_text("text", sort=True)
+        if page_text:
+            parts.append(page_text)
+    return "\n".join(parts) + "\n" if parts else ""
+
+def _extract_pages_from_shared(name: str, size: int, start: int, stop: int) -> str:
+    """Extract text from a page range of PDF content in shared memory (pool worker)"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        return _extract_pages(doc, start, stop)
+
+@lru_cache(maxsize=128)
+def _hash_file(pdf_path: str, mtime_ns: int, size: int) -> str:
+    """BLAKE3 of a file, memoized on its path, modification time and size"""
+    content_hash = blake3(max_threads=blake3.AUTO)
+    if size:
+        with open(pdf_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content_hash.update(mm)
+    return content_hash.hexdigest()
 
 class ImprovedCVReader:
     def __init__(self):
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.phone_pattern = r'(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,4}[-.\s]?\d{3,4}'
-        self.linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[A-Za-z0-9_-]+/?'
-        self.github_pattern = r'(?:https?://)?(?:www\.)?github\.com/[A-Za-z0-9_-]+/?'
-        self.date_pattern = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|\d{4}|Present|Current'
-
-        # Initialize Redis
-        try:
-            self.redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
-            print(f"Connected to Redis at {settings.REDIS_URL}")
-        except Exception as e:
-            print(f"Redis connection failed: {e}")
-            self.redis = None
+        self.email_pattern = EMAIL_RE
+        self.phone_pattern = PHONE_RE
+        self.linkedin_pattern = LINKEDIN_RE
+        self.github_pattern = GITHUB_RE
+        self.date_pattern = DATE_RE
+
+        self._redis = None
+
+    @property
+    def redis(self) -> Optional[redis.Redis]:
+        """Redis client on the shared pool, created on first use"""
+        if self._redis is None and REDIS_POOL is not None:
+            self._redis = redis.Redis(connection_pool=REDIS_POOL)
+        return self._redis
+
+    def close(self):
+        """Close pooled Redis connections and stop the page extraction pool"""
+        if REDIS_POOL is not None:
+            REDIS_POOL.disconnect()
+        _shutdown_page_pool()
 
     def get_file_hash(self, pdf_path: str) -> str:
-        """Calculate SHA256 hash of a file"""
-        sha256_hash = hashlib.sha256()
-        with open(pdf_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        """Calculate BLAKE3 hash of a file"""
+        stat = os.stat(pdf_path)
+        return _hash_file(pdf_path, stat.st_mtime_ns, stat.st_size)
 
     def _reconstruct_cv_data(self, data: Dict) -> CVData:
-        """Reconstruct CVData object from dictionary"""
-        d = data.copy()
+        """Reconstruct CVData object from dictionary, reusing the dictionary in place"""
+        d = data
 
         # Handle list of objects
         if 'work_experience' in d and d['work_experience']:
-             d['work_experience'] = [WorkExperience(**i) for i in d['work_experience']]
+             d['work_experience'] = [_load_work_experience(i) for i in d['work_experience']]
         if 'education' in d and d['education']:
-             d['education'] = [Education(**i) for i in d['education']]
+             d['education'] = [_load_education(i) for i in d['education']]
         if 'projects' in d and d['projects']:
-             d['projects'] = [Project(**i) for i in d['projects']]
+             d['projects'] = [_load_project(i) for i in d['projects']]
         if 'certifications' in d and d['certifications']:
-             d['certifications'] = [Certification(**i) for i in d['certifications']]
+             d['certifications'] = [_load_certification(i) for i in d['certifications']]
 
         return CVData(**d)
 
@@ -53,18 +180,78 @@ class ImprovedCVReader:
         """Extract text from PDF file"""
         text = ""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            with _pdf_lock, fitz.open(pdf_path) as doc:
+                text = self._extract_text(doc)
+        except Exception as e:
+            print(f"Error reading PDF: {e}")
+        if not text.strip():
+            text = self._extract_text_pdfplumber(pdf_path)
+        return text
+
+    def extract_text_from_bytes(self, data: bytes) -> str:
+        """
+        Extract text from in-memory PDF content
+        Raises fitz.FileDataError if the content is not a readable PDF
+        """
+        with _pdf_lock, fitz.open(stream=data, filetype="pdf") as doc:
+            page_count = doc.page_count
+            # Typical CVs are a few pages; parse those inline
+            if page_count <= LARGE_PDF_PAGES:
+                text = self._extract_text(doc)
+            else:
+                text = None
+        if text is None:
+            text = self._extract_text_parallel(data, page_count)
+        if not text.strip():
+            text = self._extract_text_pdfplumber(io.BytesIO(data))
+        return text
+
+    def _extract_text(self, doc) -> str:
+        """Extract text from an opened PDF document"""
+        return _extract_pages(doc, 0, doc.page_count)
+
+    def _extract_text_pdfplumber(self, source) -> str:
+        """Fallback extraction for PDFs PyMuPDF returns no text for"""
+        parts = []
+        try:
+            with pdfplumber.open(source) as pdf:
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        parts.append(page_text)
         except Exception as e:
             print(f"Error reading PDF: {e}")
-        return text
-
-    def extract_contact_info(self, text: str) -> Dict:
-        """Extract all contact information"""
-        lines = text.split('\n')[:15]  # Check first 15 lines
+        return "\n".join(parts) + "\n" if parts else ""
+
+    def _extract_text_parallel(self, data: bytes, page_count: int) -> str:
+        """Extract text from a large PDF by splitting its pages across processes"""
+        # Not threads: PyMuPDF is not thread-safe and holds the GIL while extracting
+        step = -(-page_count // settings.PDF_PAGE_WORKERS)
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+        pool = _get_page_pool()
+        # Copy the PDF into shared memory once; tasks only carry its name
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            shm.buf[:len(data)] = data
+            names = [shm.name] * len(starts)
+            sizes = [len(data)] * len(starts)
+            # map keeps results in page order
+            return "".join(pool.map(_extract_pages_from_shared, names, sizes, starts, stops))
+        except BrokenProcessPool:
+            # A pool process died (e.g. OOM-killed); extract inline rather than fail the request
+            _discard_page_pool(pool)
+            with _pdf_lock, fitz.open(stream=data, filetype="pdf") as doc:
+                return self._extract_text(doc)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def extract_contact_info(self, text: str, lines: Optional[List[str]] = None) -> Dict:
+        """Extract all contact information; lines may be passed if text is already split"""
+        if lines is None:
+            lines = text.splitlines()
+        lines = [line.strip() for line in lines[:15]]  # Check first 15 lines
         contact = {
             'name': None,
             'title': None,
@@ -77,67 +264,44 @@ class ImprovedCVReader:
 
         # Extract name (usually first non-empty line)
         for line in lines:
-            line = line.strip()
             if line and len(line) < 50 and not any(char in line for char in ['@', 'http', '+']):
-                if re.match(r'^[A-Z][a-zA-Z\s]+$', line):
+                if NAME_RE.match(line):
                     contact['name'] = line
                     break
 
         # Extract title (often second line)
         for i, line in enumerate(lines[1:5]):
-            line = line.strip()
-            if line and ('developer' in line.lower() or 'engineer' in line.lower() or 'manager' in line.lower()):
+            if line and TITLE_KEYWORD_RE.search(line):
                 contact['title'] = line
                 break
 
         # Extract location
         for line in lines:
-            if re.search(r'\b(?:Indonesia|Malaysia|Singapore|India|USA|UK)\b', line, re.IGNORECASE):
-                contact['location'] = line.strip()
+            if LOCATION_RE.search(line):
+                contact['location'] = line
                 break
 
-        # Extract email
-        emails = re.findall(self.email_pattern, text)
-        if emails:
-            contact['email'] = emails[0]
-
-        # Extract phone
-        phones = re.findall(self.phone_pattern, text)
-        if phones:
+        # Extract email, phone, LinkedIn and GitHub in a single pass
+        for match in CONTACT_RE.finditer(text):
+            key = match.lastgroup
+            if contact[key] is not None:
+                continue
+            value = match.group(key)
             # Filter out dates and keep only phone-like patterns
-            for phone in phones:
-                if len(re.sub(r'[^0-9]', '', phone)) >= 8:
-                    contact['phone'] = phone
-                    break
-
-        # Extract LinkedIn
-        linkedin = re.findall(self.linkedin_pattern, text, re.IGNORECASE)
-        if linkedin:
-            contact['linkedin'] = linkedin[0]
-
-        # Extract GitHub
-        github = re.findall(self.github_pattern, text, re.IGNORECASE)
-        if github:
-            contact['github'] = github[0]
+            if key == 'phone' and len(NON_DIGIT_RE.sub('', value)) < 8:
+                continue
+            contact[key] = value
+            if all(contact[field] is not None for field in CONTACT_FIELDS):
+                break
 
         return contact
 
-    def split_into_sections(self, text: str) -> Dict[str, str]:
-        """Split CV into major sections"""
+    def split_into_sections(self, text: str, lines: Optional[List[str]] = None) -> Dict[str, str]:
+        """Split CV into major sections; lines may be passed if text is already split"""
         sections = {}
 
-        # Define section headers with regex patterns
-        section_patterns = {
-            'summary': r'^(?:Summary|Profile|About|Objective)\s*$',
-            'technical_skills': r'^(?:Technical Skills|Skills|Competencies)\s*$',
-            'experience': r'^(?:Experience|Work Experience|Employment|Professional Experience)\s*$',
-            'education': r'^(?:Education|Academic Background|Qualifications)\s*$',
-            'projects': r'^(?:Projects|Personal Projects|Key Projects)\s*$',
-            'certifications': r'^(?:Certification|Certifications|Certificates)\s*$',
-            'volunteering': r'^(?:Volunteering|Volunteer|Community)\s*$'
-        }
-
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.splitlines()
         current_section = None
         current_content = []
 
@@ -145,19 +309,16 @@ class ImprovedCVReader:
             line_stripped = line.strip()
 
             # Check if line is a section header
-            is_header = False
-            for section_name, pattern in section_patterns.items():
-                if re.match(pattern, line_stripped, re.IGNORECASE):
-                    # Save previous section
-                    if current_section and current_content:
-                        sections[current_section] = '\n'.join(current_content)
-
-                    current_section = section_name
-                    current_content = []
-                    is_header = True
-                    break
+            header_match = SECTION_RE.match(line_stripped)
+            if header_match:
+                # Save previous section
+                if current_section and current_content:
+                    sections[current_section] = '\n'.join(current_content)
+
+                current_section = header_match.lastgroup
+                current_content = []
 
-            if not is_header and current_section:
+            elif current_section:
                 if line_stripped:  # Only add non-empty lines
                     current_content.append(line)
 
@@ -170,10 +331,9 @@ class ImprovedCVReader:
     def parse_technical_skills(self, text: str) -> Dict[str, List[str]]:
         """Parse technical skills section into categories"""
         skills = {}
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.splitlines()]
 
         for line in lines:
-            line = line.strip()
             if not line:
                 continue
 
@@ -194,11 +354,11 @@ class ImprovedCVReader:
     def parse_work_experience(self, text: str) -> List[WorkExperience]:
         """Parse work experience section"""
         experiences = []
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.splitlines()]
 
         i = 0
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
 
             # Look for pattern: "Position | Company"
             if '|' in line:
@@ -213,10 +373,10 @@ class ImprovedCVReader:
 
                 i += 1
                 if i < len(lines):
-                    next_line = lines[i].strip()
+                    next_line = lines[i]
 
                     # Extract dates
-                    date_match = re.search(r'(\w+\s+\d{4})\s*[–—-]\s*(\w+\s+\d{4}|Present|Current)', next_line)
+                    date_match = JOB_DATE_RANGE_RE.search(next_line)
                     if date_match:
                         start_date = date_match.group(1)
                         end_date = date_match.group(2)
@@ -229,7 +389,7 @@ class ImprovedCVReader:
                 responsibilities = []
                 i += 1
                 while i < len(lines):
-                    resp_line = lines[i].strip()
+                    resp_line = lines[i]
 
                     # Stop if we hit next job (contains |) or empty line after content
                     if '|' in resp_line or (not resp_line and responsibilities):
@@ -259,11 +419,11 @@ class ImprovedCVReader:
     def parse_education(self, text: str) -> List[Education]:
         """Parse education section"""
         education_list = []
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.splitlines()]
 
         i = 0
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
             if not line:
                 i += 1
                 continue
@@ -275,23 +435,23 @@ class ImprovedCVReader:
             location = ""
 
             # Look for degree name (first line without dates)
-            if line and not re.search(r'\d{4}', line):
+            if line and not YEAR_RE.search(line):
                 degree = line
 
                 # Next line should have institution and location
                 i += 1
                 if i < len(lines):
-                    next_line = lines[i].strip()
+                    next_line = lines[i]
 
                     # Look for date range pattern at the end
-                    date_match = re.search(r'(\d{4})\s*[–—-]\s*(\d{4}|Present)', line + ' ' + next_line)
+                    date_match = YEAR_RANGE_RE.search(line + ' ' + next_line)
 
                     if date_match:
                         start_date = date_match.group(1)
                         end_date = date_match.group(2)
                     else:
                         # Try to find dates in the line
-                        dates = re.findall(r'\d{4}', line + ' ' + next_line)
+                        dates = YEAR_RE.findall(line + ' ' + next_line)
                         if len(dates) >= 2:
                             start_date = dates[0]
                             end_date = dates[1]
@@ -304,7 +464,7 @@ class ImprovedCVReader:
 
                     # Parse institution and location from next_line
                     # Remove dates from the line
-                    institution_location = re.sub(r'\d{4}\s*[–—-]\s*(?:\d{4}|Present)', '', next_line).strip()
+                    institution_location = YEAR_RANGE_STRIP_RE.sub('', next_line).strip()
 
                     # Split by comma
                     parts = [p.strip() for p in institution_location.split(',')]
@@ -326,13 +486,12 @@ class ImprovedCVReader:
     def parse_projects(self, text: str) -> List[Project]:
         """Parse projects section"""
         projects = []
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.splitlines()]
 
         current_project = None
         current_description = []
 
         for line in lines:
-            line = line.strip()
             if not line:
                 continue
 
@@ -366,17 +525,19 @@ class ImprovedCVReader:
     def parse_certifications(self, text: str) -> List[Certification]:
         """Parse certifications section"""
         certifications = []
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.splitlines()]
+        # Scan each line for a date once; the issuer check reuses the next line's result
+        date_matches = [MONTH_YEAR_RE.search(line) for line in lines]
 
         i = 0
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
             if not line:
                 i += 1
                 continue
 
             # Look for certification name and date pattern
-            date_match = re.search(r'([A-Z][a-z]{2}\s+\d{4})', line)
+            date_match = date_matches[i]
 
             if date_match:
                 date = date_match.group(1)
@@ -386,9 +547,9 @@ class ImprovedCVReader:
                 # Check next line for issuer info
                 issuer = ""
                 if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
+                    next_line = lines[i + 1]
                     # If next line doesn't contain a date, it's likely the issuer
-                    if next_line and not re.search(r'[A-Z][a-z]{2}\s+\d{4}', next_line):
+                    if next_line and not date_matches[i + 1]:
                         issuer = next_line
                         i += 1
 
@@ -405,43 +566,47 @@ class ImprovedCVReader:
     def parse_volunteering(self, text: str) -> List[str]:
         """Parse volunteering section"""
         activities = []
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.splitlines()]
 
-        current_activity = None
+        current_activity = []
 
         for line in lines:
-            line = line.strip()
             if not line:
                 continue
 
             # Check if line contains a date (likely start of new activity)
-            if re.search(r'[A-Z][a-z]{2}\s+\d{4}', line):
+            if MONTH_YEAR_RE.search(line):
                 if current_activity:
-                    activities.append(current_activity)
-                current_activity = line
+                    activities.append(' '.join(current_activity))
+                current_activity = [line]
             elif current_activity:
                 # Continuation of current activity
-                current_activity += ' ' + line
+                current_activity.append(line)
 
         # Add last activity
         if current_activity:
-            activities.append(current_activity)
+            activities.append(' '.join(current_activity))
 
         return activities
 
     def parse_cv_logic(self, pdf_path: str) -> CVData:
         """Internal parsing logic without caching"""
-        text = self.extract_text_from_pdf(pdf_path)
+        return self.parse_text(self.extract_text_from_pdf(pdf_path))
 
+    def parse_text(self, text: str) -> CVData:
+        """Build CVData from extracted CV text"""
         if not text:
             print("Could not extract text from PDF")
             return CVData()
 
+        # Split once and share the lines between both passes
+        lines = text.splitlines()
+
         # Extract contact info
-        contact = self.extract_contact_info(text)
+        contact = self.extract_contact_info(text, lines)
 
         # Split into sections
-        sections = self.split_into_sections(text)
+        sections = self.split_into_sections(text, lines)
 
         # Create CV data object
         cv_data = CVData(
@@ -476,28 +641,42 @@ class ImprovedCVReader:
 
         return cv_data
 
-    def parse_cv(self, pdf_path: str) -> CVData:
-        """Main parsing method with caching"""
+    def parse_cv(self, pdf_path: str, file_hash: Optional[str] = None) -> CVData:
+        """Main parsing method with caching, keyed on the file content hash"""
+        if file_hash is None:
+            file_hash = self.get_file_hash(pdf_path)
+        return self._parse_cached(file_hash, lambda: self.parse_cv_logic(pdf_path))
+
+    def parse_cv_bytes(self, data: bytes, file_hash: Optional[str] = None) -> CVData:
+        """Parse in-memory PDF content with caching, keyed on the content hash"""
+        if file_hash is None:
+            file_hash = blake3(data).hexdigest()
+        return self._parse_cached(file_hash, lambda: self.parse_text(self.extract_text_from_bytes(data)))
+
+    def _parse_cached(self, file_hash: str, parse: Callable[[], CVData]) -> CVData:
+        """Return the cached result for file_hash, or run parse and cache it"""
+        # Raw digest bytes keep the key half the size of the hex form
+        cache_key = b"cv:b3:" + bytes.fromhex(file_hash)
+
         # Check cache
-        file_hash = self.get_file_hash(pdf_path)
         if self.redis:
             try:
-                cached_data = self.redis.get(f"cv:{file_hash}")
+                cached_data = self.redis.get(cache_key)
                 if cached_data:
                     print(f"Cache hit for {file_hash}")
-                    data_dict = json.loads(cached_data)
+                    data_dict = msgpack.unpackb(cached_data, raw=False)
                     return self._reconstruct_cv_data(data_dict)
             except Exception as e:
                 print(f"Redis get failed: {e}")
 
         # Parse
-        cv_data = self.parse_cv_logic(pdf_path)
+        cv_data = parse()
 
         # Cache
         if self.redis:
             try:
                 data_dict = dataclass_to_dict(cv_data)
-                self.redis.setex(f"cv:{file_hash}", 86400, json.dumps(data_dict)) # 24 hours
+                self.redis.setex(cache_key, 86400, msgpack.packb(data_dict, use_bin_type=True)) # 24 hours
             except Exception as e:
                 print(f"Redis set failed: {e}")
 
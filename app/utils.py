@@ -1,16 +1,52 @@
-from dataclasses import is_dataclass
+from dataclasses import fields, is_dataclass
+from typing import Dict, List, Optional
+
+# Field types that never need converting and can be copied as-is
+_SCALAR_TYPES = (str, int, float, bool, Optional[str])
+# Field types that only need a shallow copy
+_FLAT_CONTAINER_TYPES = {
+    List[str]: "list(obj.{name})",
+    Dict[str, List[str]]: "{{key: list(value) for key, value in obj.{name}.items()}}",
+}
+# Leaf values returned unchanged without any dataclass/container checks
+_LEAF_TYPES = (str, int, float, bool, type(None))
+
+_converters = {}
+
+def _make_converter(cls):
+    """Generate a dict builder for a dataclass type with its fields unrolled"""
+    items = []
+    for f in fields(cls):
+        if f.type in _SCALAR_TYPES:
+            items.append(f"{f.name!r}: obj.{f.name}")
+        elif f.type in _FLAT_CONTAINER_TYPES:
+            items.append(f"{f.name!r}: " + _FLAT_CONTAINER_TYPES[f.type].format(name=f.name))
+        else:
+            items.append(f"{f.name!r}: _convert(obj.{f.name})")
+    namespace = {"_convert": dataclass_to_dict}
+    exec(f"def convert(obj):\n    return {{{', '.join(items)}}}", namespace)
+    return namespace["convert"]
 
 def dataclass_to_dict(obj):
     """Convert dataclass objects to dictionaries recursively"""
-    if is_dataclass(obj):
-        result = {}
-        for field_name in obj.__dataclass_fields__:
-            value = getattr(obj, field_name)
-            result[field_name] = dataclass_to_dict(value)
-        return result
+    if isinstance(obj, _LEAF_TYPES):
+        return obj
+    converter = _converters.get(type(obj))
+    if converter is not None:
+        return converter(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        converter = _converters[type(obj)] = _make_converter(type(obj))
+        return converter(obj)
     elif isinstance(obj, list):
         return [dataclass_to_dict(item) for item in obj]
     elif isinstance(obj, dict):
         return {key: dataclass_to_dict(value) for key, value in obj.items()}
     else:
         return obj
+
+def make_loader(cls):
+    """Generate a constructor taking a dict and passing its fields positionally"""
+    args = ', '.join(f"d[{f.name!r}]" for f in fields(cls))
+    namespace = {"_cls": cls}
+    exec(f"def load(d):\n    return _cls({args})", namespace)
+    return namespace["load"]
@@ -4,6 +4,7 @@ Demonstrates how to use the API programmatically
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import sys
 from pathlib import Path
@@ -12,11 +13,17 @@ from pathlib import Path
 class CVReaderClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
+        # Reuse connections across calls instead of reconnecting every request
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "CVReaderClient/1.0"})
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def health_check(self):
         """Check if the API is healthy"""
         try:
-            response = requests.get(f"{self.base_url}/health")
+            response = self.session.get(f"{self.base_url}/health")
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -39,7 +46,7 @@ class CVReaderClient:
             # Open and send file
             with open(pdf_path, 'rb') as f:
                 files = {'file': (Path(pdf_path).name, f, 'application/pdf')}
-                response = requests.post(f"{self.base_url}/parse-cv", files=files)
+                response = self.session.post(f"{self.base_url}/parse-cv", files=files)
                 response.raise_for_status()
                 return response.json()
         